@@ -7,24 +7,6 @@ typedef struct {
 	char** Names;
 	int    Count;
 } InterfacesNameResponse;
-
-typedef struct {
-	char* InterfacePrivKey;
-	char* InterfacePubKey;
-	int   InterfaceListenPort;
-	char* InterfaceAddress;
-	char* InterfaceDNS;
-	char* PeerPubKey;
-	char* PeerEndpointAddress;
-	char* PeerAllowedIPs;
-	char* PeerPersistentKeepalive;
-	char* PeerPresharedKey;
-} ConfigResponse;
-
-typedef struct {
-	char* LastHandshakeTime;
-	char* Transfer;
-} StatsResponse;
 */
 import "C"
 
@@ -41,28 +23,17 @@ import (
 	"golang.zx2c4.com/wireguard/wgctrl/wgtypes"
 )
 
+// fieldSep separates the values packed into a single C string by readConfig
+// and readStats, so the caller decodes and frees one buffer per call.
+// recordSep separates the per-interface records returned by readAllStats.
+const (
+	fieldSep  = "\x1f"
+	recordSep = "\x1e"
+)
+
 //export readInterfacesName
 func readInterfacesName() *C.InterfacesNameResponse {
-	configDirs := []string{
-		"/etc/wireguard/",
-		"/usr/local/etc/wireguard/",
-	}
-
-	devices := make([]string, 0)
-
-	for _, dir := range configDirs {
-		files, err := os.ReadDir(dir)
-		if err != nil {
-			continue
-		}
-
-		for _, file := range files {
-			if !file.IsDir() && strings.HasSuffix(file.Name(), ".conf") {
-				name := strings.TrimSuffix(file.Name(), ".conf")
-				devices = append(devices, name)
-			}
-		}
-	}
+	devices := configNames()
 
 	if len(devices) == 0 {
 		return nil
@@ -81,43 +52,61 @@ func readInterfacesName() *C.InterfacesNameResponse {
 	return interfaces
 }
 
+// readInterfacesStatus returns one record per config file with the tunnel name
+// and its listen port (0 when the tunnel is down), so the caller can tell which
+// tunnels are active without a readConfig call per tunnel.
+//
+//export readInterfacesStatus
+func readInterfacesStatus() *C.char {
+	ports := make(map[string]int)
+
+	client, err := wgctrl.New()
+	if err == nil {
+		devices, err := client.Devices()
+		if err == nil {
+			for _, device := range devices {
+				if len(device.Peers) > 0 {
+					ports[device.Name] = device.ListenPort
+				}
+			}
+		}
+		client.Close()
+	}
+
+	names := configNames()
+	records := make([]string, 0, len(names))
+	for _, name := range names {
+		records = append(records, name+fieldSep+strconv.Itoa(ports[name]))
+	}
+
+	return C.CString(strings.Join(records, recordSep))
+}
+
 //export readConfig
-func readConfig(name *C.char) *C.ConfigResponse {
+func readConfig(name *C.char) *C.char {
 	client, err := wgctrl.New()
 	if err != nil {
 		return nil
 	}
 	defer client.Close()
 
-	cfg := (*C.ConfigResponse)(C.malloc(C.size_t(unsafe.Sizeof(C.ConfigResponse{}))))
-	cfg.InterfacePrivKey = C.CString("")
-	cfg.InterfacePubKey = C.CString("")
-	cfg.InterfaceListenPort = 0
-	cfg.InterfaceAddress = C.CString("")
-	cfg.InterfaceDNS = C.CString("")
-	cfg.PeerPubKey = C.CString("")
-	cfg.PeerEndpointAddress = C.CString("")
-	cfg.PeerAllowedIPs = C.CString("")
-	cfg.PeerPersistentKeepalive = C.CString("")
-	cfg.PeerPresharedKey = C.CString("")
+	interfaceName := C.GoString(name)
 
-	device, err := client.Device(C.GoString(name))
+	device, err := client.Device(interfaceName)
 	if err != nil {
-		interfacePubKey, peerPubKey := parseKeys(C.GoString(name))
+		interfacePubKey, peerPubKey := parseKeys(interfaceName)
 		if interfacePubKey == "" && peerPubKey == "" {
 			return nil
 		}
 
-		cfg.InterfacePubKey = C.CString(interfacePubKey)
-		cfg.PeerPubKey = C.CString(peerPubKey)
-		return cfg
+		return packFields("", interfacePubKey, "0", "", "", peerPubKey, "", "", "", "")
 	}
 
 	if len(device.Peers) == 0 {
 		return nil
 	}
 
-	address, dns, alive, psk := parseConfig(C.GoString(name))
+	address, dns, alive, psk := parseConfig(interfaceName)
 
 	peer := device.Peers[0]
 
@@ -126,31 +115,28 @@ func readConfig(name *C.char) *C.ConfigResponse {
 		ips = append(ips, ipNet.String())
 	}
 
-	cfg.InterfacePrivKey = C.CString(device.PrivateKey.String())
-	cfg.InterfacePubKey = C.CString(device.PublicKey.String())
-	cfg.InterfaceListenPort = C.int(device.ListenPort)
-	cfg.InterfaceAddress = C.CString(address)
-	cfg.InterfaceDNS = C.CString(dns)
-	cfg.PeerPubKey = C.CString(peer.PublicKey.String())
-	cfg.PeerEndpointAddress = C.CString(peer.Endpoint.String())
-	cfg.PeerAllowedIPs = C.CString(strings.Join(ips, ","))
-	cfg.PeerPersistentKeepalive = C.CString(alive)
-	cfg.PeerPresharedKey = C.CString(psk)
-	return cfg
+	return packFields(
+		device.PrivateKey.String(),
+		device.PublicKey.String(),
+		strconv.Itoa(device.ListenPort),
+		address,
+		dns,
+		peer.PublicKey.String(),
+		peer.Endpoint.String(),
+		strings.Join(ips, ","),
+		alive,
+		psk,
+	)
 }
 
 //export readStats
-func readStats(name *C.char) *C.StatsResponse {
+func readStats(name *C.char) *C.char {
 	client, err := wgctrl.New()
 	if err != nil {
 		return nil
 	}
 	defer client.Close()
 
-	cfg := (*C.StatsResponse)(C.malloc(C.size_t(unsafe.Sizeof(C.StatsResponse{}))))
-	cfg.LastHandshakeTime = C.CString("")
-	cfg.Transfer = C.CString("")
-
 	device, err := client.Device(C.GoString(name))
 	if err != nil {
 		return nil
@@ -162,9 +148,41 @@ func readStats(name *C.char) *C.StatsResponse {
 
 	peer := device.Peers[0]
 
-	cfg.LastHandshakeTime = C.CString(parseTime(peer.LastHandshakeTime))
-	cfg.Transfer = C.CString(parseTraffic(peer.ReceiveBytes, peer.TransmitBytes))
-	return cfg
+	return packFields(
+		parseTime(peer.LastHandshakeTime),
+		parseTraffic(peer.ReceiveBytes, peer.TransmitBytes),
+	)
+}
+
+//export readAllStats
+func readAllStats() *C.char {
+	client, err := wgctrl.New()
+	if err != nil {
+		return nil
+	}
+	defer client.Close()
+
+	devices, err := client.Devices()
+	if err != nil {
+		return nil
+	}
+
+	records := make([]string, 0, len(devices))
+	for _, device := range devices {
+		if len(device.Peers) == 0 {
+			continue
+		}
+
+		peer := device.Peers[0]
+
+		records = append(records, strings.Join([]string{
+			device.Name,
+			parseTime(peer.LastHandshakeTime),
+			parseTraffic(peer.ReceiveBytes, peer.TransmitBytes),
+		}, fieldSep))
+	}
+
+	return C.CString(strings.Join(records, recordSep))
 }
 
 //export generateKeys
@@ -195,58 +213,39 @@ func freeInterfacesName(interfaces *C.InterfacesNameResponse) {
 	}
 }
 
-//export freeConfig
-func freeConfig(cfg *C.ConfigResponse) {
-	if cfg != nil {
-		if cfg.InterfacePrivKey != nil {
-			C.free(unsafe.Pointer(cfg.InterfacePrivKey))
-		}
-		if cfg.InterfacePubKey != nil {
-			C.free(unsafe.Pointer(cfg.InterfacePubKey))
-		}
-		if cfg.InterfaceAddress != nil {
-			C.free(unsafe.Pointer(cfg.InterfaceAddress))
-		}
-		if cfg.InterfaceDNS != nil {
-			C.free(unsafe.Pointer(cfg.InterfaceDNS))
-		}
-		if cfg.PeerEndpointAddress != nil {
-			C.free(unsafe.Pointer(cfg.PeerEndpointAddress))
-		}
-		if cfg.PeerPubKey != nil {
-			C.free(unsafe.Pointer(cfg.PeerPubKey))
-		}
-		if cfg.PeerAllowedIPs != nil {
-			C.free(unsafe.Pointer(cfg.PeerAllowedIPs))
-		}
-		if cfg.PeerPersistentKeepalive != nil {
-			C.free(unsafe.Pointer(cfg.PeerPersistentKeepalive))
-		}
-		if cfg.PeerPresharedKey != nil {
-			C.free(unsafe.Pointer(cfg.PeerPresharedKey))
-		}
-		C.free(unsafe.Pointer(cfg))
+//export freeString
+func freeString(str *C.char) {
+	if str != nil {
+		C.free(unsafe.Pointer(str))
 	}
 }
 
-//export freeStats
-func freeStats(cfg *C.StatsResponse) {
-	if cfg != nil {
-		if cfg.LastHandshakeTime != nil {
-			C.free(unsafe.Pointer(cfg.LastHandshakeTime))
+func packFields(fields ...string) *C.char {
+	return C.CString(strings.Join(fields, fieldSep))
+}
+
+func configNames() []string {
+	configDirs := []string{
+		"/etc/wireguard/",
+		"/usr/local/etc/wireguard/",
+	}
+
+	names := make([]string, 0)
+
+	for _, dir := range configDirs {
+		files, err := os.ReadDir(dir)
+		if err != nil {
+			continue
 		}
-		if cfg.Transfer != nil {
-			C.free(unsafe.Pointer(cfg.Transfer))
+
+		for _, file := range files {
+			if !file.IsDir() && strings.HasSuffix(file.Name(), ".conf") {
+				names = append(names, strings.TrimSuffix(file.Name(), ".conf"))
+			}
 		}
-		C.free(unsafe.Pointer(cfg))
 	}
-}
 
-//export freeString
-func freeString(str *C.char) {
-	if str != nil {
-		C.free(unsafe.Pointer(str))
-	}
+	return names
 }
 
 func parseConfig(interfaceName string) (string, string, string, string) {
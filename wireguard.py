@@ -1,14 +1,19 @@
 import ctypes
+import io
+import math
 import os
-import re
+import stat
+import string
 import sys
 import subprocess
-import zipfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple, List
+from typing import Dict, Iterator, Tuple, List, Optional
 
-from PySide6.QtCore import Qt, QPoint, QTimer, QRegularExpression
+from PySide6.QtCore import Qt, QPoint, QTimer, Signal
 from PySide6.QtWidgets import (
   QApplication,
   QMainWindow,
@@ -25,22 +30,25 @@ from PySide6.QtWidgets import (
   QFormLayout,
   QLineEdit,
   QTextEdit,
+  QPlainTextEdit,
   QDialogButtonBox,
   QMessageBox,
   QGroupBox,
   QScrollArea,
   QSpacerItem,
   QSystemTrayIcon,
-  QStyle,
-  QSizePolicy
+  QStyle
 )
 from PySide6.QtGui import (
   QIcon,
   QResizeEvent,
   QPainter,
+  QPixmap,
   QColor,
   QPaintEvent,
   QCloseEvent,
+  QShowEvent,
+  QHideEvent,
   QMouseEvent,
   QTextCharFormat,
   QSyntaxHighlighter,
@@ -48,8 +56,185 @@ from PySide6.QtGui import (
 )
 
 
+# NOTE: (heycatch) interface naming rules are present in man8.
+# Link: https://www.man7.org/linux/man-pages/man8/wg-quick.8.html
+_TUNNEL_NAME_EDGE_CHARS = frozenset(string.ascii_letters + string.digits)
+_TUNNEL_NAME_CHARS = string.ascii_letters + string.digits + "_=+.-"
+
+def _is_valid_tunnel_name(name: str) -> bool:
+  if not name or len(name) > 17 or len(name) == 2: return False
+  if name[0] not in _TUNNEL_NAME_EDGE_CHARS: return False
+  if name[-1] not in _TUNNEL_NAME_EDGE_CHARS: return False
+
+  return not name.strip(_TUNNEL_NAME_CHARS)
+
+_BORDERED_BUTTON_SS = """
+  QPushButton {
+    padding: 5px;
+    border: 1px solid #4FC3F7;
+    border-radius: 3px;
+  }
+  QPushButton:hover {
+    background: #dae7ed;
+  }
+"""
+
+_GROUP_SS = """
+  QGroupBox {
+    border: 1px solid #ada9aa;
+    margin-top: 10px;
+    font-size: 12px;
+  }
+  QGroupBox:title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    left: 10px;
+  }
+  QLabel#configValue {
+    background-color: #fbfbfb;
+  }
+"""
+
+_TUNNEL_BUTTON_SS_TEMPLATE = """
+  QPushButton {{
+    background: {background};
+    border: none;
+    text-align: left;
+    padding: 4px 4px 4px 18px;
+    font-size: 13px;
+  }}
+  QPushButton:hover {{
+    background: #dae7ed;
+  }}
+"""
+_TUNNEL_BUTTON_SS = _TUNNEL_BUTTON_SS_TEMPLATE.format(background="transparent")
+_TUNNEL_BUTTON_SS_SELECTED = _TUNNEL_BUTTON_SS_TEMPLATE.format(background="#dae7ed")
+
+_STATUS_SS_TEMPLATE = "background-color: {color}; border-radius: 5px;"
+_STATUS_SS_ACTIVE = _STATUS_SS_TEMPLATE.format(color="#4CAF50")
+_STATUS_SS_INACTIVE = _STATUS_SS_TEMPLATE.format(color="#808080")
+
+_IMPORT_BUTTON_SS = "font-weight: bold; font-size: 15px;"
+
+# Swapped in with os.replace so wg-quick never reads a half-written file.
+# A new config holds a private key, so it is created 0600.
+def _write_config(path: str, text: str) -> None:
+  try:
+    mode = stat.S_IMODE(os.stat(path).st_mode)
+  except FileNotFoundError:
+    mode = 0o600
+
+  tmp_path = f"{path}.tmp"
+  fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+
+  try:
+    with open(fd, "wb") as f:
+      os.fchmod(fd, mode)
+      f.write(text.encode("utf-8"))
+      f.flush()
+      os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+  except Exception:
+    if os.path.exists(tmp_path): os.remove(tmp_path)
+    raise
+
+# Renamed over the target so an interrupted import never leaves a half-copied config.
+# The data is not fsynced; that guards against a killed process, not a power loss.
+def _copy_config(pair: Tuple[str, str], copyfile: callable) -> Optional[OSError]:
+  src_path, dest_path = pair
+  tmp_path = f"{dest_path}.tmp"
+
+  try:
+    try:
+      mode = stat.S_IMODE(os.stat(dest_path).st_mode)
+    except FileNotFoundError:
+      mode = 0o600
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+      os.fchmod(fd, mode)
+    finally:
+      os.close(fd)
+
+    copyfile(src_path, tmp_path)
+    os.replace(tmp_path, dest_path)
+  except OSError as e:
+    if os.path.exists(tmp_path): os.remove(tmp_path)
+    return e
+
+  return None
+
+_LOG_MAX_LINES = 20000
+
+_ZIP_BUFFER_SIZE = 1 << 20
+
+# Below this size DEFLATE output is often larger than the input.
+_ZIP_STORE_LIMIT = 4096
+
+_ZIP_MEMORY_LIMIT = 16 << 20
+
+_NOT_A_CONFIG_FILE = (FileNotFoundError, IsADirectoryError, NotADirectoryError)
+
+def _import_configs(config_dir: str, pairs: List[Tuple[str, str]]) -> List[str]:
+  # shutil and concurrent.futures are only needed once an import runs, both are slow to load.
+  import shutil
+  from concurrent.futures import ThreadPoolExecutor
+
+  with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+    errors = list(executor.map(lambda pair: _copy_config(pair, shutil.copyfile), pairs))
+
+  failed = [
+    f"{os.path.basename(file_path)}: {str(error)}"
+    for (file_path, _), error in zip(pairs, errors) if error is not None
+  ]
+
+  if len(failed) < len(pairs):
+    try:
+      fd = os.open(config_dir, os.O_RDONLY | os.O_DIRECTORY)
+      try:
+        os.fsync(fd)
+      finally:
+        os.close(fd)
+    except OSError:
+      pass
+
+  return failed
+
+def _write_archive(conf_files: List[os.DirEntry], zip_path: str) -> None:
+  import zipfile
+
+  staged = sum(conf_file.stat().st_size for conf_file in conf_files) <= _ZIP_MEMORY_LIMIT
+
+  if staged: raw = io.BytesIO()
+  else: raw = open(zip_path, "wb", buffering=_ZIP_BUFFER_SIZE)
+
+  with raw:
+    with zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+      for conf_file in conf_files:
+        with open(conf_file.path, "rb") as src:
+          data = src.read()
+
+        st = conf_file.stat()
+        zinfo = zipfile.ZipInfo(conf_file.name, time.localtime(st.st_mtime)[:6])
+        if len(data) < _ZIP_STORE_LIMIT: zinfo.compress_type = zipfile.ZIP_STORED
+        else: zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+
+        zipf.writestr(zinfo, data, compresslevel=zipf.compresslevel)
+
+    if staged:
+      with open(zip_path, "wb") as out, raw.getbuffer() as view:
+        try:
+          os.posix_fallocate(out.fileno(), 0, len(view))
+        except OSError:
+          pass
+        out.write(view)
+
 class Config:
   _local_mode = os.getenv("LOCAL") == "ON"
+  _folders = ("/etc/wireguard", "/usr/local/etc/wireguard")
+  _config_dir = None
 
   @classmethod
   def get_icons(cls) -> Tuple[str, str]:
@@ -70,73 +255,123 @@ class Config:
     else: return Path("/opt/wirewizard/lib/wirewizard.so")
 
   @classmethod
-  def get_folders(cls) -> List[str]:
-    return ["/etc/wireguard", "/usr/local/etc/wireguard"]
+  def get_folders(cls) -> Tuple[str, ...]:
+    return cls._folders
 
   @classmethod
   def get_paths(cls, tunnel_name: str) -> List[str]:
     return [f"{folder}/{tunnel_name}.conf" for folder in cls.get_folders()]
 
+  @classmethod
+  def resolve_config_dir(cls) -> Optional[str]:
+    if cls._config_dir is None:
+      cls._config_dir = next(
+        (folder for folder in cls.get_folders() if os.path.isdir(folder)), None
+      )
+
+    return cls._config_dir
+
+def _validate_tunnel_name(name: str, current_name: Optional[str] = None) -> Optional[str]:
+  if not name: return "Tunnel name cannot be empty."
+
+  if not _is_valid_tunnel_name(name): return "Incorrect name for the tunnel is entered."
+
+  config_dir = Config.resolve_config_dir()
+  if not config_dir: return "Configuration dirs do not exist."
+
+  if not os.access(config_dir, os.W_OK): return f"No write permission for {config_dir}."
+
+  if name != current_name and os.path.isfile(os.path.join(config_dir, f"{name}.conf")):
+    return f"Configuration file for {name} already exists."
+
+  return None
+
+class ConfigCache:
+  def __init__(self, maxsize: int = 100):
+    self.maxsize = maxsize
+    self.entries = OrderedDict()
+
+  def get(self, key: tuple) -> Optional[dict]:
+    config = self.entries.get(key)
+    if config is not None: self.entries.move_to_end(key)
+    return config
+
+  def put(self, key: tuple, config: dict) -> None:
+    self.entries[key] = config
+    self.entries.move_to_end(key)
+    if len(self.entries) > self.maxsize: self.entries.popitem(last=False)
+
+class InterfacesNameResponse(ctypes.Structure):
+  _fields_ = [
+    ("Names", ctypes.POINTER(ctypes.c_char_p)),
+    ("Count", ctypes.c_int)
+  ]
+
 class Wireguard:
+  FIELD_SEPARATOR = "\x1f"
+  RECORD_SEPARATOR = "\x1e"
+
+  # Order must match the packFields calls in wireguard.go.
+  CONFIG_FIELDS = (
+    "interface_priv_key",
+    "interface_pub_key",
+    "interface_listen_port",
+    "interface_address",
+    "interface_dns",
+    "peer_pub_key",
+    "peer_endpoint_address",
+    "peer_allowed_ips",
+    "peer_keep_alive",
+    "peer_psk_key"
+  )
+  STATS_FIELDS = ("last_handshake", "transfer")
+
+  lib = None
+
   def __init__(self):
-    lib = Config.get_lib()
-    if not lib.exists():
-      raise FileNotFoundError(f"WireGuard library not found at {lib}")
+    self.wg = self.load_lib()
+    self.config_cache = ConfigCache()
+    self.interfaces_cache = None
 
-    self.wg = ctypes.CDLL(str(lib))
+  @classmethod
+  def load_lib(cls) -> ctypes.CDLL:
+    if cls.lib is not None: return cls.lib
 
-    class InterfacesNameResponse(ctypes.Structure):
-      _fields_ = [
-        ("Names", ctypes.POINTER(ctypes.c_char_p)),
-        ("Count", ctypes.c_int)
-      ]
+    path = Config.get_lib()
+    if not path.exists():
+      raise FileNotFoundError(f"WireGuard library not found at {path}")
 
-    class ConfigResponse(ctypes.Structure):
-      _fields_ = [
-        ("InterfacePrivKey", ctypes.c_char_p),
-        ("InterfacePubKey", ctypes.c_char_p),
-        ("InterfaceListenPort", ctypes.c_int),
-        ("InterfaceAddress", ctypes.c_char_p),
-        ("InterfaceDNS", ctypes.c_char_p),
-        ("PeerPubKey", ctypes.c_char_p),
-        ("PeerEndpointAddress", ctypes.c_char_p),
-        ("PeerAllowedIPs", ctypes.c_char_p),
-        ("PeerPersistentKeepalive", ctypes.c_char_p),
-        ("PeerPresharedKey", ctypes.c_char_p)
-      ]
+    lib = ctypes.CDLL(str(path))
 
-    class StatsResponse(ctypes.Structure):
-      _fields_ = [
-        ("LastHandshakeTime", ctypes.c_char_p),
-        ("Transfer", ctypes.c_char_p)
-      ]
-
-    self.wg.generateKeys.argtypes = [
+    lib.generateKeys.argtypes = [
       ctypes.POINTER(ctypes.c_char_p),
       ctypes.POINTER(ctypes.c_char_p)
     ]
-    self.wg.generateKeys.restype = ctypes.c_char_p
+    lib.generateKeys.restype = ctypes.c_void_p
 
-    self.wg.readInterfacesName.restype = ctypes.POINTER(InterfacesNameResponse)
-    self.wg.readInterfacesName.argtypes = []
+    lib.readInterfacesName.restype = ctypes.POINTER(InterfacesNameResponse)
+    lib.readInterfacesName.argtypes = []
 
-    self.wg.readConfig.restype = ctypes.POINTER(ConfigResponse)
-    self.wg.readConfig.argtypes = [ctypes.c_char_p]
+    lib.readConfig.restype = ctypes.c_void_p
+    lib.readConfig.argtypes = [ctypes.c_char_p]
 
-    self.wg.readStats.restype = ctypes.POINTER(StatsResponse)
-    self.wg.readStats.argtypes = [ctypes.c_char_p]
+    lib.readStats.restype = ctypes.c_void_p
+    lib.readStats.argtypes = [ctypes.c_char_p]
 
-    self.wg.freeString.restype = None
-    self.wg.freeString.argtypes = [ctypes.c_char_p]
+    lib.readAllStats.restype = ctypes.c_void_p
+    lib.readAllStats.argtypes = []
 
-    self.wg.freeInterfacesName.restype = None
-    self.wg.freeInterfacesName.argtypes = [ctypes.POINTER(InterfacesNameResponse)]
+    lib.readInterfacesStatus.restype = ctypes.c_void_p
+    lib.readInterfacesStatus.argtypes = []
 
-    self.wg.freeConfig.restype = None
-    self.wg.freeConfig.argtypes = [ctypes.POINTER(ConfigResponse)]
+    lib.freeString.restype = None
+    lib.freeString.argtypes = [ctypes.c_void_p]
 
-    self.wg.freeStats.restype = None
-    self.wg.freeStats.argtypes = [ctypes.POINTER(StatsResponse)]
+    lib.freeInterfacesName.restype = None
+    lib.freeInterfacesName.argtypes = [ctypes.POINTER(InterfacesNameResponse)]
+
+    cls.lib = lib
+    return lib
 
   def generate_keys(self) -> Tuple[str, str]:
     priv_key = ctypes.c_char_p()
@@ -154,62 +389,143 @@ class Wireguard:
 
     return result
 
+  # Adding, removing or renaming a .conf bumps its folder's mtime, which keys the cache.
   def read_interfaces_name(self) -> List[str]:
+    key = self._folders_key()
+
+    if self.interfaces_cache is None or self.interfaces_cache[0] != key:
+      self.interfaces_cache = (key, self._read_interfaces_name())
+
+    return list(self.interfaces_cache[1])
+
+  def _folders_key(self) -> tuple:
+    key = []
+
+    for folder in Config.get_folders():
+      try:
+        key.append(os.stat(folder).st_mtime_ns)
+      except OSError:
+        key.append(None)
+
+    return tuple(key)
+
+  def _read_interfaces_name(self) -> List[str]:
     interfaces_ptr = self.wg.readInterfacesName()
     if not interfaces_ptr: return []
 
-    names = []
     interfaces = interfaces_ptr.contents
 
-    try:
-      for i in range(interfaces.Count):
-        name = interfaces.Names[i].decode("utf-8")
-        names.append(name)
-    finally:
-      self.wg.freeInterfacesName(interfaces_ptr)
+    names = interfaces.Names[:interfaces.Count]
+    self.wg.freeInterfacesName(interfaces_ptr)
 
-    return names
+    return [name.decode("utf-8", "replace") for name in names]
 
+  # An up tunnel's config carries live device fields (the endpoint can roam), so only
+  # down tunnels, whose config comes from the .conf alone, are cached. Failed reads are not.
   def read_config(self, interface: str) -> dict:
-    cfg_ptr = self.wg.readConfig(interface.encode("utf-8"))
-    if not cfg_ptr: return {}
+    if self.is_up(interface): return self._read_config(interface)
 
-    cfg = cfg_ptr.contents
+    key = self._config_key(interface)
 
-    try:
-      return {
-        "interface_priv_key": self._str_decode(cfg.InterfacePrivKey),
-        "interface_pub_key": self._str_decode(cfg.InterfacePubKey),
-        "interface_listen_port": cfg.InterfaceListenPort,
-        "interface_address": self._str_decode(cfg.InterfaceAddress),
-        "interface_dns": self._str_decode(cfg.InterfaceDNS),
-        "peer_pub_key": self._str_decode(cfg.PeerPubKey),
-        "peer_endpoint_address": self._str_decode(cfg.PeerEndpointAddress),
-        "peer_allowed_ips": self._str_decode(cfg.PeerAllowedIPs),
-        "peer_keep_alive": self._str_decode(cfg.PeerPersistentKeepalive),
-        "peer_psk_key": self._str_decode(cfg.PeerPresharedKey)
-      }
-    finally:
-      self.wg.freeConfig(cfg_ptr)
+    config = self.config_cache.get(key)
+    if config is None:
+      config = self._read_config(interface)
+      if config: self.config_cache.put(key, config)
+
+    return dict(config)
+
+  def _config_key(self, interface: str) -> tuple:
+    key = [interface]
+
+    for path in Config.get_paths(interface):
+      try:
+        st = os.stat(path)
+      except OSError:
+        continue
+      key.append((path, st.st_mtime_ns, st.st_size))
+
+    return tuple(key)
+
+  def is_up(self, interface: str) -> bool:
+    return os.path.exists(f"/sys/class/net/{interface}")
+
+  def _read_config(self, interface: str) -> dict:
+    values = self._read_fields(self.wg.readConfig(interface.encode("utf-8")))
+    if len(values) != len(self.CONFIG_FIELDS): return {}
+
+    config = dict(zip(self.CONFIG_FIELDS, values))
+    config["interface_listen_port"] = int(config["interface_listen_port"] or 0)
+    return config
 
   def read_stats(self, interface: str) -> dict:
-    cfg_ptr = self.wg.readStats(interface.encode("utf-8"))
-    if not cfg_ptr: return {}
+    values = self._read_fields(self.wg.readStats(interface.encode("utf-8")))
+    if len(values) != len(self.STATS_FIELDS): return {}
+
+    return dict(zip(self.STATS_FIELDS, values))
+
+  def read_all_stats(self) -> Dict[str, dict]:
+    stats = {}
+
+    for record in self._read_string(self.wg.readAllStats()).split(self.RECORD_SEPARATOR):
+      name, *values = record.split(self.FIELD_SEPARATOR)
+      if len(values) == len(self.STATS_FIELDS):
+        stats[name] = dict(zip(self.STATS_FIELDS, values))
+
+    return stats
+
+  def read_interfaces_status(self) -> Dict[str, int]:
+    status = {}
 
-    cfg = cfg_ptr.contents
+    for record in self._read_string(self.wg.readInterfacesStatus()).split(self.RECORD_SEPARATOR):
+      name, *values = record.split(self.FIELD_SEPARATOR)
+      if len(values) == 1: status[name] = int(values[0] or 0)
+
+    return status
+
+  # wg-quick also runs the PreUp/PostDown hooks and sets DNS and fwmark rules,
+  # which wgctrl cannot do, so tunnels are still switched through it.
+  def wg_quick(self, action: str, interface: str, append_log: callable = None) -> bool:
+    cmd = ["wg-quick", action, interface]
+
+    if append_log: output = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE}
+    else: output = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
 
     try:
-      return {
-        "last_handshake": self._str_decode(cfg.LastHandshakeTime),
-        "transfer": self._str_decode(cfg.Transfer)
-      }
-    finally:
-      self.wg.freeStats(cfg_ptr)
+      res = subprocess.run(cmd, check=True, timeout=20, **output)
+    except subprocess.CalledProcessError as e:
+      if append_log: append_log(cmd, self._decode(e.stdout), self._decode(e.stderr))
+      return False
+    except subprocess.TimeoutExpired as e:
+      if append_log:
+        stderr = f"{self._decode(e.stderr)}Timed out after {e.timeout} seconds.\n"
+        append_log(cmd, self._decode(e.stdout), stderr)
+      return False
 
-  def _str_decode(self, c_str: ctypes.c_char_p) -> str:
-    return c_str.decode("utf-8") if c_str else ""
+    if append_log: append_log(cmd, self._decode(res.stdout), self._decode(res.stderr))
+    return True
+
+  @staticmethod
+  def _decode(output: Optional[bytes]) -> str:
+    return output.decode("utf-8", "replace") if output else ""
+
+  def _read_fields(self, ptr: Optional[int]) -> List[str]:
+    if not ptr: return []
+    return self._read_string(ptr).split(self.FIELD_SEPARATOR)
+
+  def _read_string(self, ptr: Optional[int]) -> str:
+    if not ptr: return ""
+
+    data = ctypes.string_at(ptr)
+    self.wg.freeString(ptr)
+
+    return data.decode("utf-8", "replace")
 
 class WireGuardHighlighter(QSyntaxHighlighter):
+  SECTIONS = frozenset({"[Interface]", "[Peer]"})
+  SECRET_KEYS = frozenset({"PrivateKey", "PublicKey", "PresharedKey"})
+  IP_KEYS = frozenset({"Address", "DNS", "AllowedIPs", "Endpoint"})
+  DIGITS = frozenset("0123456789")
+
   def __init__(self, parent=None):
     super().__init__(parent)
 
@@ -226,60 +542,73 @@ class WireGuardHighlighter(QSyntaxHighlighter):
     self.special_value_format = QTextCharFormat()
     self.special_value_format.setForeground(QColor("#64492d"))
 
-    self.section_pattern = QRegularExpression(r"^\s*\[(Interface|Peer)\]\s*$")
-    self.key_value_pattern = QRegularExpression(r"^\s*([A-Za-z]+)\s*=\s*(.+)$")
-    octet = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
-    self.ip_pattern = QRegularExpression(
-      r"(" + octet + r"\." + octet + r"\." + octet + r"\." + octet + r")([:/]\d+)(?:,|\s|$)?"
-    )
-
   def highlightBlock(self, text: str) -> None:
-    section_match = self.section_pattern.match(text)
-    if section_match.hasMatch():
-      self.setFormat(
-        section_match.capturedStart(0),
-        section_match.capturedLength(0),
-        self.section_format
-      )
+    length = len(text)
+
+    start = 0
+    while start < length and text[start].isspace(): start += 1
+    if start == length or text[start] == "#": return
+
+    if text[start] == "[":
+      if text.strip() in self.SECTIONS: self.setFormat(0, length, self.section_format)
       return
 
-    key_value_match = self.key_value_pattern.match(text)
-    if key_value_match.hasMatch():
-      self.setFormat(
-        key_value_match.capturedStart(1),
-        key_value_match.capturedLength(1),
-        self.key_format
-      )
+    key_end = start
+    while key_end < length and text[key_end].isascii() and text[key_end].isalpha():
+      key_end += 1
+    if key_end == start: return
 
-      if key_value_match.captured(1) in ["PrivateKey", "PublicKey", "PresharedKey"]:
-        self.setFormat(
-          key_value_match.capturedStart(2),
-          key_value_match.capturedLength(2),
-          self.special_value_format
-        )
-      else:
-        self.setFormat(
-          key_value_match.capturedStart(2),
-          key_value_match.capturedLength(2),
-          self.value_format
-        )
+    pos = key_end
+    while pos < length and text[pos].isspace(): pos += 1
+    if pos + 1 >= length or text[pos] != "=": return
 
-        ip_match_iterator = self.ip_pattern.globalMatch(
-          key_value_match.captured(2).strip()
-        )
-        while ip_match_iterator.hasNext():
-          ip_match = ip_match_iterator.next()
+    pos += 1
+    while pos < length - 1 and text[pos].isspace(): pos += 1
 
-          self.setFormat(
-            key_value_match.capturedStart(2) + ip_match.capturedStart(1),
-            ip_match.capturedStart(1),
-            self.value_format
-          )
-          self.setFormat(
-            key_value_match.capturedStart(2) + ip_match.capturedStart(2),
-            ip_match.capturedLength(2),
-            self.special_value_format
-          )
+    self.setFormat(start, key_end - start, self.key_format)
+
+    key = text[start:key_end]
+    if key in self.SECRET_KEYS:
+      self.setFormat(pos, length - pos, self.special_value_format)
+      return
+
+    self.setFormat(pos, length - pos, self.value_format)
+
+    if key not in self.IP_KEYS: return
+
+    for suffix_start, suffix_end in self.ip_suffixes(text, pos):
+      self.setFormat(suffix_start, suffix_end - suffix_start, self.special_value_format)
+
+  @classmethod
+  def ip_suffixes(cls, text: str, pos: int) -> Iterator[Tuple[int, int]]:
+    length = len(text)
+
+    while pos < length:
+      if text[pos] not in cls.DIGITS:
+        pos += 1
+        continue
+
+      run_end = pos
+      while run_end < length and (text[run_end] in cls.DIGITS or text[run_end] == "."):
+        run_end += 1
+
+      octets = text[pos:run_end].split(".")
+      pos = run_end
+
+      if len(octets) != 4 or not all(cls.is_octet(octet) for octet in octets): continue
+      if run_end + 1 >= length or text[run_end] not in ":/": continue
+
+      suffix_end = run_end + 1
+      while suffix_end < length and text[suffix_end] in cls.DIGITS: suffix_end += 1
+      if suffix_end == run_end + 1: continue
+
+      yield run_end, suffix_end
+      pos = suffix_end
+
+  @staticmethod
+  def is_octet(octet: str) -> bool:
+    if not octet or len(octet) > 3 or (len(octet) > 1 and octet[0] == "0"): return False
+    return int(octet) <= 255
 
 class TunnelCreationDialog(QDialog):
   def __init__(self, wireguard: Wireguard, parent=None):
@@ -315,18 +644,7 @@ class TunnelCreationDialog(QDialog):
     self.highlighter = WireGuardHighlighter(self.text_edit)
 
     button_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
-    button_box.setStyleSheet(
-      """
-      QPushButton {
-        padding: 5px;
-        border: 1px solid #4FC3F7;
-        border-radius: 3px;
-      }
-      QPushButton:hover {
-        background: #dae7ed;
-      }
-      """
-    )
+    button_box.setStyleSheet(_BORDERED_BUTTON_SS)
     button_box.accepted.connect(self.save_config)
     button_box.rejected.connect(self.reject)
 
@@ -341,12 +659,11 @@ class TunnelCreationDialog(QDialog):
     if not self.validate_config(name): return
 
     try:
-      with open(
-        os.path.join(self.config_dir, f"{name}.conf"), "w", encoding="utf-8"
-      ) as f:
-        f.write(self.text_edit.toPlainText())
+      _write_config(
+        os.path.join(self.config_dir, f"{name}.conf"), self.text_edit.toPlainText()
+      )
 
-        self.accept()
+      self.accept()
     except Exception as e:
       QMessageBox.warning(
         self,
@@ -355,47 +672,12 @@ class TunnelCreationDialog(QDialog):
       )
 
   def validate_config(self, name: str) -> bool:
-    if not name:
-      QMessageBox.warning(self, "Error", "Tunnel name cannot be empty.")
-      return False
-
-    """
-    NOTE: (heycatch) interface naming rules are present in man8.
-    Link: https://www.man7.org/linux/man-pages/man8/wg-quick.8.html
-    """
-    if not re.match(r"^[a-zA-Z0-9](?:[a-zA-Z0-9_=+.-]{1,15}[a-zA-Z0-9])?$", name):
-      QMessageBox.warning(
-        self,
-        "Error",
-        "Incorrect name for the tunnel is entered."
-      )
-      return False
-
-    for folder in Config.get_folders():
-      if os.path.isdir(folder):
-        self.config_dir = folder
-        break
-
-    if not self.config_dir:
-      QMessageBox.warning(self, "Error", "Configuration dirs do not exist.")
-      return False
-
-    if not os.access(self.config_dir, os.W_OK):
-      QMessageBox.warning(
-        self,
-        "Error",
-        f"No write permission for {self.config_dir}."
-      )
-      return False
-
-    if os.path.isfile(os.path.join(self.config_dir, f"{name}.conf")):
-      QMessageBox.warning(
-        self,
-        "Error",
-        f"Configuration file for {name} already exists."
-      )
+    error = _validate_tunnel_name(name)
+    if error:
+      QMessageBox.warning(self, "Error", error)
       return False
 
+    self.config_dir = Config.resolve_config_dir()
     return True
 
 class TunnelEditDialog(QDialog):
@@ -415,6 +697,7 @@ class TunnelEditDialog(QDialog):
     self.append_log = append_log
 
     self.config_file = None
+    self.config_size = 0
     self.config_dir = None
     self.name_input = None
     self.highlighter = None
@@ -439,18 +722,7 @@ class TunnelEditDialog(QDialog):
     layout.addWidget(self.text_edit)
 
     button_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
-    button_box.setStyleSheet(
-      """
-      QPushButton {
-        padding: 5px;
-        border: 1px solid #4FC3F7;
-        border-radius: 3px;
-      }
-      QPushButton:hover {
-        background: #dae7ed;
-      }
-      """
-    )
+    button_box.setStyleSheet(_BORDERED_BUTTON_SS)
     button_box.accepted.connect(self.save_config)
     button_box.rejected.connect(self.reject)
     layout.addWidget(button_box)
@@ -461,8 +733,14 @@ class TunnelEditDialog(QDialog):
 
   def load_config(self) -> None:
     for path in Config.get_paths(self.tunnel_name):
-      if os.path.isfile(path):
+      try:
+        config_stat = os.stat(path)
+      except OSError:
+        continue
+
+      if stat.S_ISREG(config_stat.st_mode):
         self.config_file = path
+        self.config_size = config_stat.st_size
         break
 
     if not self.config_file:
@@ -475,8 +753,16 @@ class TunnelEditDialog(QDialog):
       return
 
     try:
-      with open(self.config_file, "r", encoding="utf-8") as f:
-        self.text_edit.setPlainText(f.read())
+      fd = os.open(self.config_file, os.O_RDONLY)
+      try:
+        data = os.read(fd, self.config_size + 1)
+        # The file grew after the stat, read the rest.
+        if len(data) > self.config_size:
+          with open(fd, "rb", closefd=False) as f: data += f.read()
+      finally:
+        os.close(fd)
+
+      self.text_edit.setPlainText(data.decode("utf-8"))
     except Exception as e:
       QMessageBox.warning(
         self,
@@ -493,12 +779,7 @@ class TunnelEditDialog(QDialog):
       if new_name != self.tunnel_name:
         config = self.wireguard.read_config(self.tunnel_name)
         if config.get("interface_listen_port", 0) != 0:
-          try:
-            cmd = ["wg-quick", "down", self.tunnel_name]
-            res = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=20)
-            self.append_log(cmd, res.stdout, res.stderr)
-          except subprocess.CalledProcessError as e:
-            self.append_log(cmd, e.stdout, e.stderr)
+          if not self.wireguard.wg_quick("down", self.tunnel_name, self.append_log):
             QMessageBox.warning(
               self,
               "Error",
@@ -510,8 +791,7 @@ class TunnelEditDialog(QDialog):
         os.rename(self.config_file, new_config_path)
         self.config_file = new_config_path
 
-      with open(self.config_file, "w", encoding="utf-8") as f:
-        f.write(self.text_edit.toPlainText())
+      _write_config(self.config_file, self.text_edit.toPlainText())
 
       self.accept()
     except Exception as e:
@@ -523,52 +803,17 @@ class TunnelEditDialog(QDialog):
       self.reject()
 
   def validate_config(self, name: str) -> bool:
-    if not name:
-      QMessageBox.warning(self, "Error", "Tunnel name cannot be empty.")
-      return False
-
-    """
-    NOTE: (heycatch) interface naming rules are present in man8.
-    Link: https://www.man7.org/linux/man-pages/man8/wg-quick.8.html
-    """
-    if not re.match(r"^[a-zA-Z0-9](?:[a-zA-Z0-9_=+.-]{1,15}[a-zA-Z0-9])?$", name):
-      QMessageBox.warning(
-        self,
-        "Error",
-        "Incorrect name for the tunnel is entered."
-      )
-      return False
-
-    for folder in Config.get_folders():
-      if os.path.isdir(folder):
-        self.config_dir = folder
-        break
-
-    if not self.config_dir:
-      QMessageBox.warning(self, "Error", "Configuration dirs do not exist.")
-      return False
-
-    if not os.access(self.config_dir, os.W_OK):
-      QMessageBox.warning(
-        self,
-        "Error",
-        f"No write permission for {self.config_dir}."
-      )
-      return False
-
-    if name != self.tunnel_name and os.path.isfile(
-      os.path.join(self.config_dir, f"{name}.conf")
-    ):
-      QMessageBox.warning(
-        self,
-        "Error",
-        f"Configuration file for {name} already exists."
-      )
+    error = _validate_tunnel_name(name, current_name=self.tunnel_name)
+    if error:
+      QMessageBox.warning(self, "Error", error)
       return False
 
+    self.config_dir = Config.resolve_config_dir()
     return True
 
 class TunnelButton(QPushButton):
+  status_dots = {}
+
   def __init__(self, name: str, is_active: bool = False, parent=None):
     super().__init__(name, parent)
     self.is_active = is_active
@@ -578,34 +823,39 @@ class TunnelButton(QPushButton):
     self.update_style()
 
   def update_style(self) -> None:
-    background = "#dae7ed" if self.is_selected else "transparent"
-
-    self.setStyleSheet(
-      f"""
-      QPushButton {{
-        background: {background};
-        border: none;
-        text-align: left;
-        padding: 4px 4px 4px 18px;
-        font-size: 13px;
-      }}
-      QPushButton:hover {{
-        background: #dae7ed;
-      }}
-      """
-    )
+    self.setStyleSheet(_TUNNEL_BUTTON_SS_SELECTED if self.is_selected else _TUNNEL_BUTTON_SS)
 
   def paintEvent(self, event: QPaintEvent) -> None:
     super().paintEvent(event)
 
     painter = QPainter(self)
-    painter.setRenderHint(QPainter.Antialiasing)
+    painter.drawPixmap(5, 9, self.status_dot(self.is_active, self.devicePixelRatioF()))
 
-    painter.setBrush(QColor("#4CAF50" if self.is_active else "#808080"))
-    painter.setPen(Qt.NoPen)
-    painter.drawEllipse(5, 9, 9, 9)
+  @classmethod
+  def status_dot(cls, is_active: bool, ratio: float) -> QPixmap:
+    key = (is_active, ratio)
+
+    pixmap = cls.status_dots.get(key)
+    if pixmap is None:
+      size = math.ceil(10 * ratio)
+      pixmap = QPixmap(size, size)
+      pixmap.setDevicePixelRatio(ratio)
+      pixmap.fill(Qt.transparent)
+
+      painter = QPainter(pixmap)
+      painter.setRenderHint(QPainter.Antialiasing)
+      painter.setBrush(QColor("#4CAF50" if is_active else "#808080"))
+      painter.setPen(Qt.NoPen)
+      painter.drawEllipse(0, 0, 9, 9)
+      painter.end()
+
+      cls.status_dots[key] = pixmap
+
+    return pixmap
 
   def set_selected(self, selected: bool) -> None:
+    if selected == self.is_selected: return
+
     self.is_selected = selected
 
     self.update_style()
@@ -616,147 +866,144 @@ class TunnelButton(QPushButton):
       if isinstance(main_window, MainWindow):
         tunnel_name = self.text()
         if tunnel_name in main_window.selected_tunnels:
-          main_window.selected_tunnels.remove(tunnel_name)
+          main_window.selected_tunnels.discard(tunnel_name)
           self.set_selected(False)
           main_window.clear_right_panel()
         else:
-          main_window.selected_tunnels.append(tunnel_name)
+          main_window.selected_tunnels.add(tunnel_name)
           self.set_selected(True)
     else:
       super().mousePressEvent(event)
 
 class TunnelConfigWidget(QWidget):
-  def __init__(
-    self,
-    name: str,
-    config: dict,
-    stats: dict,
-    wireguard: Wireguard,
-    is_active: bool = False,
-    parent=None
-  ):
+  label_widths = {}
+
+  INTERFACE_LABELS = ("Public key:  ", "Listen port:  ", "Addresses:  ", "DNS servers:  ")
+  PEER_LABELS = (
+    "Public key:  ",
+    "Preshared key:  ",
+    "Allowed IPs:  ",
+    "Endpoint:  ",
+    "Persistent keepalive:  ",
+    "Latest handshake:  ",
+    "Transfer:  "
+  )
+
+  def __init__(self, parent=None):
     super().__init__(parent)
     self.layout = QVBoxLayout()
     self.layout.setContentsMargins(0, 0, 0, 0)
 
-    self.name = name
-    self.wireguard = wireguard
-    self.is_active = is_active
+    self.name = None
+    self.is_active = False
 
     self.field_widget = {}
 
-    group_style = """
-      QGroupBox {
-        border: 1px solid #ada9aa;
-        margin-top: 10px;
-        font-size: 12px;
-      }
-      QGroupBox:title {
-        subcontrol-origin: margin;
-        subcontrol-position: top left;
-        left: 10px;
-      }
-    """
-
-    interface_group = QGroupBox(f"Interface: {name}")
-    interface_group.setStyleSheet(group_style)
-    interface_layout = QVBoxLayout()
-    interface_layout.setContentsMargins(10, 10, 10, 10)
-    interface_layout.setSpacing(5)
-
-    inteface_fields = [
-      ("Public key:  ", config.get("interface_pub_key", "")),
-      ("Listen port:  ", str(
-        config.get(
-          "interface_listen_port"
-        )) if config.get("interface_listen_port", 0) else ""),
-      ("Addresses:  ", config.get("interface_address", "")),
-      ("DNS servers:  ", config.get("interface_dns", ""))
-    ]
-
-    interface_label_width = []
-    for label_text, value in inteface_fields:
-      if value: interface_label_width.append(self.fontMetrics().horizontalAdvance(label_text))
-    interface_max_width = max(interface_label_width)
-    interface_max_length = max(len(field[0]) if field[1] else 0 for field in inteface_fields)
+    self.interface_group = QGroupBox()
+    self.interface_group.setStyleSheet(_GROUP_SS)
+    self.interface_layout = QVBoxLayout()
+    self.interface_layout.setContentsMargins(10, 10, 10, 10)
+    self.interface_layout.setSpacing(5)
 
     status_layout = QHBoxLayout()
-    status_label = QLabel("Status:  ")
-    status_label.setFixedWidth(interface_max_width)
-    status_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-    status_label.setFixedHeight(20)
+    self.status_label = QLabel("Status:  ")
+    self.status_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+    self.status_label.setFixedHeight(20)
     self.status_indicator = QLabel()
     self.status_indicator.setFixedSize(11, 11)
-    self.status_indicator.setStyleSheet(
-      f"background-color: {'#4CAF50' if is_active else '#808080'}; border-radius: 5px;"
-    )
-    status_text = QLabel("Active" if is_active else "Inactive")
-    status_layout.addWidget(status_label)
+    self.status_indicator.setStyleSheet(_STATUS_SS_INACTIVE)
+    self.status_text = QLabel()
+    status_layout.addWidget(self.status_label)
     status_layout.addWidget(self.status_indicator)
-    status_layout.addWidget(status_text)
+    status_layout.addWidget(self.status_text)
     status_layout.addStretch()
-    interface_layout.addLayout(status_layout)
-
-    for label_text, value in inteface_fields:
-      if not value: continue
+    self.interface_layout.addLayout(status_layout)
 
-      field_layout = QHBoxLayout()
-      label = QLabel(label_text)
-      label.setFixedWidth(interface_max_width)
-      label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
-
-      value_edit = QTextEdit(value)
-      value_edit.setReadOnly(True)
-      value_edit.setFrameStyle(QFrame.NoFrame)
-      value_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-      value_edit.setAlignment(Qt.AlignmentFlag.AlignTop)
-      """
-      NOTE: (heycatch) we use QTextEdit for convenient line wrapping,
-      but it has an internal frame that needs to be removed for correct
-      display. To do this, we we use 'document().setDocumentMargin(0)' and
-      a fixed length in 'setMaximumHeight' for normal bottom maring.
-      TODO: (heycatch) find a more dynamic and
-      convenient way besides 'setMaximumHeight'.
-      """
-      value_edit.document().setDocumentMargin(0)
-      if is_active and (len(value) >= 44 and interface_max_length >= 19) or len(value) >= 63:
-        value_edit.setMaximumHeight(30)
-      else:
-        value_edit.setMaximumHeight(20)
-      value_edit.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-      value_edit.setStyleSheet("background-color: #fbfbfb;")
-
-      field_layout.addWidget(label)
-      field_layout.addWidget(value_edit)
-      interface_layout.addLayout(field_layout)
+    self.interface_rows = [
+      self.add_row(self.interface_layout, label_text) for label_text in self.INTERFACE_LABELS
+    ]
 
     button_layout = QHBoxLayout()
-    button_layout.addSpacerItem(QSpacerItem(interface_max_width + 5, 0))
-    self.active_button = QPushButton("Activate" if not is_active else "Deactivate")
+    self.button_spacer = QSpacerItem(0, 0)
+    button_layout.addSpacerItem(self.button_spacer)
+    self.active_button = QPushButton()
     self.active_button.setFixedSize(100, 25)
-    self.active_button.setStyleSheet(
-      """
-      QPushButton {
-        padding: 5px;
-        border: 1px solid #4FC3F7;
-        border-radius: 3px;
-      }
-      QPushButton:hover {
-        background: #dae7ed;
-      }
-      """
-    )
+    self.active_button.setStyleSheet(_BORDERED_BUTTON_SS)
     button_layout.addWidget(self.active_button)
     button_layout.addStretch()
-    interface_layout.addLayout(button_layout)
-    interface_group.setLayout(interface_layout)
+    self.interface_layout.addLayout(button_layout)
+    self.interface_group.setLayout(self.interface_layout)
 
     peer_group = QGroupBox("Peer")
-    peer_group.setStyleSheet(group_style)
+    peer_group.setStyleSheet(_GROUP_SS)
     peer_layout = QVBoxLayout()
     peer_layout.setContentsMargins(10, 10, 10, 10)
     peer_layout.setSpacing(5)
 
+    self.peer_rows = [
+      self.add_row(peer_layout, label_text) for label_text in self.PEER_LABELS
+    ]
+    for label_text, (_, _, value_edit) in zip(self.PEER_LABELS, self.peer_rows):
+      if label_text in ("Latest handshake:  ", "Transfer:  "):
+        self.field_widget[label_text] = value_edit
+
+    peer_group.setLayout(peer_layout)
+
+    self.layout.addWidget(self.interface_group)
+    self.layout.addWidget(peer_group)
+    self.layout.addStretch()
+    self.setLayout(self.layout)
+
+  def add_row(self, layout: QVBoxLayout, label_text: str) -> Tuple[QWidget, QLabel, QLabel]:
+    row = QWidget()
+    field_layout = QHBoxLayout()
+    field_layout.setContentsMargins(0, 0, 0, 0)
+
+    label = QLabel(label_text)
+    label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
+
+    value_edit = QLabel()
+    value_edit.setWordWrap(True)
+    value_edit.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+    value_edit.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+    # Styled by the QLabel#configValue rule in _GROUP_SS.
+    value_edit.setObjectName("configValue")
+
+    field_layout.addWidget(label)
+    field_layout.addWidget(value_edit)
+    row.setLayout(field_layout)
+    layout.addWidget(row)
+
+    return row, label, value_edit
+
+  def retarget(self, name: str, config: dict, stats: dict, is_active: bool = False) -> None:
+    if is_active != self.is_active:
+      self.status_indicator.setStyleSheet(
+        _STATUS_SS_ACTIVE if is_active else _STATUS_SS_INACTIVE
+      )
+
+    self.name = name
+    self.is_active = is_active
+
+    self.interface_group.setTitle(f"Interface: {name}")
+    self.status_text.setText("Active" if is_active else "Inactive")
+    self.active_button.setText("Activate" if not is_active else "Deactivate")
+
+    inteface_fields = [
+      ("Public key:  ", config.get("interface_pub_key", "")),
+      ("Listen port:  ", str(
+        config.get(
+          "interface_listen_port"
+        )) if config.get("interface_listen_port", 0) else ""),
+      ("Addresses:  ", config.get("interface_address", "")),
+      ("DNS servers:  ", config.get("interface_dns", ""))
+    ]
+
+    interface_max_width = self.fill_rows(self.interface_rows, inteface_fields)
+    self.status_label.setFixedWidth(interface_max_width)
+    self.button_spacer.changeSize(interface_max_width + 5, 0)
+    self.interface_layout.invalidate()
+
     peer_fields = [
       ("Public key:  ", config.get("peer_pub_key", "")),
       ("Preshared key:  ", "enabled" if config.get("peer_psk_key", "") else ""),
@@ -767,92 +1014,72 @@ class TunnelConfigWidget(QWidget):
       ("Transfer:  ", stats.get("transfer", ""))
     ]
 
-    peer_label_widths = []
-    for label_text, value in peer_fields:
-      if value: peer_label_widths.append(self.fontMetrics().horizontalAdvance(label_text))
-    peer_max_width = max(peer_label_widths)
-    peer_max_length = max(len(field[0]) if field[1] else 0 for field in peer_fields)
+    self.fill_rows(self.peer_rows, peer_fields)
 
-    for label_text, value in peer_fields:
-      if not value: continue
-
-      field_layout = QHBoxLayout()
-      label = QLabel(label_text)
-      label.setFixedWidth(peer_max_width)
-      label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
-
-      value_edit = QTextEdit(value)
-      value_edit.setReadOnly(True)
-      value_edit.setFrameStyle(QFrame.NoFrame)
-      value_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-      value_edit.setAlignment(Qt.AlignmentFlag.AlignTop)
-      """
-      NOTE: (heycatch) we use QTextEdit for convenient line wrapping,
-      but it has an internal frame that needs to be removed for correct
-      display. To do this, we we use 'document().setDocumentMargin(0)' and
-      a fixed length in 'setMaximumHeight' for normal bottom maring.
-      TODO: (heycatch) find a more dynamic and
-      convenient way besides 'setMaximumHeight'.
-      """
-      value_edit.document().setDocumentMargin(0)
-      if is_active and (len(value) >= 44 and peer_max_length >= 19) or len(value) >= 63:
-        value_edit.setMaximumHeight(30)
-      else:
-        value_edit.setMaximumHeight(20)
-      value_edit.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-      value_edit.setStyleSheet("background-color: #fbfbfb;")
+  def fill_rows(
+    self,
+    rows: List[Tuple[QWidget, QLabel, QLabel]],
+    fields: List[Tuple[str, str]]
+  ) -> int:
+    max_width = self.max_label_width(fields)
 
-      field_layout.addWidget(label)
-      field_layout.addWidget(value_edit)
+    for (row, label, value_edit), (_, value) in zip(rows, fields):
+      row.setVisible(bool(value))
+      label.setFixedWidth(max_width)
+      value_edit.setText(value)
 
-      if label_text in ("Latest handshake:  ", "Transfer:  "):
-        self.field_widget[label_text] = value_edit
+    return max_width
 
-      peer_layout.addLayout(field_layout)
+  def max_label_width(self, fields: List[Tuple[str, str]]) -> int:
+    font = self.font()
+    font_key = (font.family(), font.pointSize())
 
-    peer_group.setLayout(peer_layout)
+    max_width = 0
+    for label_text, value in fields:
+      if not value: continue
 
-    self.layout.addWidget(interface_group)
-    self.layout.addWidget(peer_group)
-    self.layout.addStretch()
-    self.setLayout(self.layout)
+      key = (font_key, label_text)
+      width = self.label_widths.get(key)
+      if width is None:
+        width = self.label_widths[key] = self.fontMetrics().horizontalAdvance(label_text)
+      max_width = max(max_width, width)
 
-    self.update_timer = QTimer(self)
-    self.update_timer.setInterval(60000)
-    self.update_timer.timeout.connect(self.update_stats)
-    if self.is_active: self.update_timer.start()
+    return max_width
 
-  def update_stats(self) -> None:
-    if not self.is_active:
-      self.update_timer.stop()
-      return
+  def update_stats(self, name: str, stats: dict) -> None:
+    if name != self.name or not self.is_active or not stats: return
 
-    stats = self.wireguard.read_stats(self.name)
-    if stats:
-      if "Latest handshake:  " in self.field_widget:
-        self.field_widget["Latest handshake:  "].setText(stats.get("last_handshake", ""))
-      if "Transfer:  " in self.field_widget:
-        self.field_widget["Transfer:  "].setText(stats.get("transfer", ""))
+    self.field_widget["Latest handshake:  "].setText(stats.get("last_handshake", ""))
+    self.field_widget["Transfer:  "].setText(stats.get("transfer", ""))
 
 class MainWindow(QMainWindow):
+  stats_ready = Signal(str, dict)
+  import_done = Signal(int, list)
+  export_done = Signal(str, int, str)
+
   def __init__(self):
     super().__init__()
-    self.active_icon, self.default_icon = Config.get_icons()
+    active_icon, default_icon = Config.get_icons()
+    self.active_icon = QIcon(active_icon)
+    self.default_icon = QIcon(default_icon)
+    self.icon_state = None
 
     self.setWindowTitle("WireGuard")
-    self.setWindowIcon(QIcon(self.default_icon))
+    self.setWindowIcon(self.default_icon)
     self.setFixedSize(750, 550)
 
     self.wireguard = Wireguard()
 
-    self.logs = ""
-    self.edit_button = None
     self.selected_tunnel = None
-    self.selected_button = None
-    self.selected_tunnels = []
+    self.selected_tunnels = set()
+    self.buttons = {}
+    self.iface_cache = None
+    self.reload_scheduled = False
+    self.io_busy = False
+    self.io_thread = None
 
     self.tray_icon = QSystemTrayIcon(self)
-    self.tray_icon.setIcon(QIcon(self.default_icon))
+    self.tray_icon.setIcon(self.default_icon)
     tray_menu = QMenu()
     open_acton = tray_menu.addAction("Show")
     open_acton.triggered.connect(self.showNormal)
@@ -873,6 +1100,7 @@ class MainWindow(QMainWindow):
     self.tunnels_tab = QWidget()
     self.tabs.addTab(self.tunnels_tab, "Tunnels")
     self.setup_tunnels_tab()
+    self.setup_context_menus()
 
     self.logs_tab = QWidget()
     self.tabs.addTab(self.logs_tab, "Logs")
@@ -882,6 +1110,10 @@ class MainWindow(QMainWindow):
 
     self.load_interfaces()
 
+    self.stats_timer = QTimer(self)
+    self.stats_timer.setInterval(60000)
+    self.stats_timer.timeout.connect(self.update_stats)
+
   def setup_tunnels_tab(self) -> None:
     main_layout = QVBoxLayout()
     content_layout = QHBoxLayout()
@@ -915,12 +1147,29 @@ class MainWindow(QMainWindow):
     self.right_panel = QWidget()
     self.right_layout = QVBoxLayout()
     self.right_layout.setContentsMargins(0, 0, 0, 0)
+
+    self.import_widget = QWidget()
+    import_layout = QVBoxLayout()
+    import_layout.setContentsMargins(0, 0, 0, 0)
     import_btn = QPushButton("Import tunnel(s) from file")
-    import_btn.setStyleSheet("font-weight: bold; font-size: 15px;")
+    import_btn.setStyleSheet(_IMPORT_BUTTON_SS)
     import_btn.clicked.connect(self.import_tunnels)
-    self.right_layout.addStretch()
-    self.right_layout.addWidget(import_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-    self.right_layout.addStretch()
+    import_layout.addStretch()
+    import_layout.addWidget(import_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+    import_layout.addStretch()
+    self.import_widget.setLayout(import_layout)
+
+    self.config_widget = TunnelConfigWidget()
+    self.config_widget.active_button.clicked.connect(
+      lambda: self.toggle_tunnel(self.config_widget.is_active)
+    )
+    self.config_widget.hide()
+    self.stats_ready.connect(self.config_widget.update_stats)
+    self.import_done.connect(self.import_finished)
+    self.export_done.connect(self.export_finished)
+
+    self.right_layout.addWidget(self.import_widget)
+    self.right_layout.addWidget(self.config_widget)
     self.right_panel.setLayout(self.right_layout)
 
     content_layout.addWidget(self.left_panel)
@@ -987,6 +1236,13 @@ class MainWindow(QMainWindow):
     self.bottom_layout.addWidget(self.button_panel)
     self.bottom_layout.addStretch()
 
+    self.edit_button = QPushButton("Edit")
+    self.edit_button.setFixedSize(100, 25)
+    self.edit_button.setStyleSheet(_BORDERED_BUTTON_SS)
+    self.edit_button.clicked.connect(lambda: self.edit_tunnel())
+    self.edit_button.hide()
+    self.bottom_layout.addWidget(self.edit_button)
+
     main_layout.addLayout(content_layout, 1)
     main_layout.addLayout(self.bottom_layout)
 
@@ -1001,11 +1257,10 @@ class MainWindow(QMainWindow):
     log_layout = QVBoxLayout()
     log_layout.setContentsMargins(0, 0, 0, 0)
 
-    self.logs_text = QTextEdit()
+    self.logs_text = QPlainTextEdit()
     self.logs_text.setReadOnly(True)
-    self.logs_text.setFontFamily("Monospace")
-    self.logs_text.setFontPointSize(10)
-    self.logs_text.setPlainText(self.logs)
+    self.logs_text.setFont(QFont("Monospace", 10))
+    self.logs_text.setMaximumBlockCount(_LOG_MAX_LINES)
     log_layout.addWidget(self.logs_text)
 
     log_frame.setLayout(log_layout)
@@ -1015,18 +1270,7 @@ class MainWindow(QMainWindow):
     button_layout.addStretch()
     save_button = QPushButton("Save")
     save_button.setFixedSize(100, 25)
-    save_button.setStyleSheet(
-      """
-      QPushButton {
-        padding: 5px;
-        border: 1px solid #4FC3F7;
-        border-radius: 3px;
-      }
-      QPushButton:hover {
-        background: #dae7ed;
-      }
-      """
-    )
+    save_button.setStyleSheet(_BORDERED_BUTTON_SS)
     save_button.clicked.connect(self.save_logs)
     button_layout.addWidget(save_button)
 
@@ -1035,7 +1279,7 @@ class MainWindow(QMainWindow):
     self.logs_tab.setLayout(layout)
 
   def save_logs(self) -> None:
-    if not self.logs:
+    if self.logs_text.document().isEmpty():
       QMessageBox.warning(self, "Error", "The logs are empty.")
       return
 
@@ -1048,8 +1292,9 @@ class MainWindow(QMainWindow):
     if file_dialog.exec():
       file_path = file_dialog.selectedFiles()[0]
       try:
-        with open(file_path, "w", encoding="utf-8") as f:
-          f.write(self.logs)
+        data = (self.logs_text.toPlainText() + "\n").encode("utf-8")
+        with open(file_path, "wb") as f:
+          f.write(data)
 
         QMessageBox.information(
           self,
@@ -1065,100 +1310,185 @@ class MainWindow(QMainWindow):
 
     super().closeEvent(event)
 
+  def showEvent(self, event: QShowEvent) -> None:
+    self.stats_timer.start()
+    self.update_stats()
+
+    super().showEvent(event)
+
+  def hideEvent(self, event: QHideEvent) -> None:
+    self.stats_timer.stop()
+
+    super().hideEvent(event)
+
   def resizeEvent(self, event: QResizeEvent) -> None:
     self.left_panel.setFixedWidth(self.width() // 3)
     self.button_panel.setMaximumWidth(self.width() // 3)
 
     super().resizeEvent(event)
 
-  def set_icon(self) -> None:
-    is_active = False
-    for interface in self.wireguard.read_interfaces_name():
-      config = self.wireguard.read_config(interface)
-      if config.get("interface_listen_port", 0) != 0:
-        is_active = True
-        break
+  def set_icon(self, status: Optional[Dict[str, int]] = None) -> None:
+    if status is None: status = self.wireguard.read_interfaces_status()
+    is_active = any(port != 0 for port in status.values())
+
+    if is_active == self.icon_state: return
+    self.icon_state = is_active
+
+    icon = self.active_icon if is_active else self.default_icon
+    self.setWindowIcon(icon)
+    self.tray_icon.setIcon(icon)
+
+  # Shared by the handlers of one event: dropped on the next event loop turn,
+  # or right away with invalidate_ifaces after wg-quick or a file change.
+  def iface_snapshot(self) -> Dict[str, dict]:
+    if self.iface_cache is None:
+      self.iface_cache = {
+        name: self.wireguard.read_config(name)
+        for name in self.wireguard.read_interfaces_name()
+      }
+      QTimer.singleShot(0, self.invalidate_ifaces)
+
+    return self.iface_cache
 
-    self.setWindowIcon(QIcon(
-      self.active_icon if is_active else self.default_icon
-    ))
-    self.tray_icon.setIcon(QIcon(
-      self.active_icon if is_active else self.default_icon
-    ))
+  def peek_iface(self, name: str) -> Optional[dict]:
+    if self.iface_cache is None: return None
+    return self.iface_cache.get(name)
+
+  def invalidate_ifaces(self) -> None:
+    self.iface_cache = None
+
+  def update_stats(self) -> None:
+    if not self.isVisible(): return
+    if self.config_widget.isHidden() or not self.config_widget.is_active: return
+
+    for name, stats in self.wireguard.read_all_stats().items():
+      self.stats_ready.emit(name, stats)
 
   def tray_icon_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
     if reason == QSystemTrayIcon.Trigger: self.showNormal()
 
   def quit_application(self) -> None:
-    for interface in self.wireguard.read_interfaces_name():
-      config = self.wireguard.read_config(interface)
-      if config.get("interface_listen_port", 0) != 0:
-        try:
-          subprocess.run(["wg-quick", "down", interface], check=True)
-        except subprocess.CalledProcessError:
-          QMessageBox.warning(self, "Error", f"Failed to stop tunnel {interface}.")
+    # A running import or export is let finish, so no .tmp config or cut-off zip is left.
+    if self.io_thread is not None: self.io_thread.join()
 
-    QApplication.quit()
+    active = [
+      interface for interface, config in self.iface_snapshot().items()
+      if config.get("interface_listen_port", 0) != 0
+    ]
 
-  def load_interfaces(self) -> None:
-    if hasattr(self, "left_panel"): self.left_widget.deleteLater()
+    if active:
+      from concurrent.futures import ThreadPoolExecutor
 
-    self.left_widget = QWidget()
-    self.left_layout = QVBoxLayout()
-    self.left_layout.setContentsMargins(0, 0, 0, 0)
-    self.left_layout.setSpacing(0)
-    self.left_widget.setLayout(self.left_layout)
+      with ThreadPoolExecutor(max_workers=len(active)) as executor:
+        results = list(executor.map(lambda i: self.wireguard.wg_quick("down", i), active))
 
-    scroll_area = self.left_panel.findChild(QScrollArea)
-    scroll_area.setWidget(self.left_widget)
+      for interface, stopped in zip(active, results):
+        if not stopped:
+          QMessageBox.warning(self, "Error", f"Failed to stop tunnel {interface}.")
 
-    for name in self.wireguard.read_interfaces_name():
-      config = self.wireguard.read_config(name)
+    QApplication.quit()
 
-      button = TunnelButton(
-        name, is_active=config.get("interface_listen_port", 0) != 0
-      )
-      button.clicked.connect(lambda _, n=name: self.show_tunnel(n))
-      button.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-      button.customContextMenuRequested.connect(
-        lambda pos, n=name, b=button: self.show_context_menu(
-          pos, from_button=True, tunnel_name=n, sender=b
-        )
-      )
-      self.left_layout.addWidget(button)
+  def load_interfaces(self) -> None:
+    status = self.wireguard.read_interfaces_status()
+
+    for name in [name for name in self.buttons if name not in status]:
+      button = self.buttons.pop(name)
+      self.left_layout.removeWidget(button)
+      button.deleteLater()
+
+    for index, (name, port) in enumerate(status.items()):
+      is_active = port != 0
+
+      button = self.buttons.get(name)
+      if button is None:
+        button = TunnelButton(name, is_active=is_active)
+        button.clicked.connect(self.tunnel_clicked)
+        button.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        button.customContextMenuRequested.connect(self.tunnel_context_menu)
+        button.set_selected(name == self.selected_tunnel or name in self.selected_tunnels)
+        self.buttons[name] = button
+      elif button.is_active != is_active:
+        button.is_active = is_active
+        button.update()
+
+      if self.left_layout.indexOf(button) != index:
+        self.left_layout.removeWidget(button)
+        self.left_layout.insertWidget(index, button)
+
+    self.set_icon(status)
+
+  def tunnel_clicked(self, checked: bool = False) -> None:
+    self.show_tunnel(self.sender().text())
+
+  def tunnel_context_menu(self, position: QPoint) -> None:
+    button = self.sender()
+    self.show_context_menu(
+      position, from_button=True, tunnel_name=button.text(), sender=button
+    )
 
-    self.set_icon()
+  def schedule_reload(self) -> None:
+    if self.reload_scheduled: return
 
-    self.left_layout.addStretch()
+    self.reload_scheduled = True
+    QTimer.singleShot(0, self.reload_interfaces)
+
+  def reload_interfaces(self) -> None:
+    self.reload_scheduled = False
+    self.load_interfaces()
 
-  # NOTE: (heycatch) if logs exceed the 6MB limit, half of the old logs are cleaned up.
   def append_log(self, cmd: List[str], stdout: str, stderr: str) -> None:
     date = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]"
-    self.logs += f"{date} {' '.join(cmd)}:\n{stdout}{stderr}\n"
-
-    if len(self.logs) > 6000000: self.logs = self.logs[-6000000 // 2:]
-    if hasattr(self, "logs_text"): self.logs_text.setPlainText(self.logs)
+    self.logs_text.appendPlainText(f"{date} {' '.join(cmd)}:\n{stdout}{stderr}")
 
   def clear_right_panel(self) -> None:
-    while self.right_layout.count():
-      item = self.right_layout.takeAt(0)
-      if item.widget(): item.widget().deleteLater()
+    self.config_widget.hide()
+    self.import_widget.show()
 
     self.selected_tunnel = None
-    self.selected_button = None
 
-    if self.edit_button:
-      self.bottom_layout.removeWidget(self.edit_button)
-      self.edit_button.deleteLater()
-      self.edit_button = None
+    self.edit_button.hide()
 
-    import_btn = QPushButton("Import tunnel(s) from file")
-    import_btn.setStyleSheet("font-weight: bold; font-size: 15px;")
-    import_btn.clicked.connect(self.import_tunnels)
-    self.right_layout.addStretch()
-    self.right_layout.addWidget(import_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-    self.right_layout.addStretch()
-    self.right_panel.setLayout(self.right_layout)
+  def setup_context_menus(self) -> None:
+    self.button_menu = QMenu(self)
+
+    self.button_toggle_action = self.button_menu.addAction("Toggle")
+    self.button_toggle_action.triggered.connect(self.toggle_tunnel)
+
+    self.button_menu.addSeparator()
+
+    self.button_menu.addAction("Import tunnel(s) from file...").setEnabled(False)
+    self.button_menu.addAction("Add empty tunnel...").setEnabled(False)
+    self.button_menu.addAction("Export all tunnels to zip...").setEnabled(False)
+
+    self.button_menu.addSeparator()
+
+    self.button_edit_action = self.button_menu.addAction("Edit selected tunnel...")
+    self.button_edit_action.triggered.connect(lambda: self.edit_tunnel())
+    self.button_remove_action = self.button_menu.addAction("Remove selected tunnel(s)...")
+    self.button_remove_action.triggered.connect(self.remove_tunnel)
+
+    self.button_menu.addAction("Select all").setEnabled(False)
+
+    self.panel_menu = QMenu(self)
+
+    self.panel_menu.addAction("Toggle").setEnabled(False)
+
+    self.panel_menu.addSeparator()
+
+    self.panel_menu.addAction("Import tunnel(s) from file...", self.import_tunnels)
+    self.panel_menu.addAction("Add empty tunnel...", self.create_tunnel)
+    self.panel_export_action = self.panel_menu.addAction("Export all tunnels to zip...")
+    self.panel_export_action.triggered.connect(self.export_tunnels)
+
+    self.panel_menu.addSeparator()
+
+    self.panel_menu.addAction("Edit selected tunnel...").setEnabled(False)
+    self.panel_menu.addAction("Remove selected tunnel(s)...").setEnabled(False)
+
+    self.panel_unselect_all_action = self.panel_menu.addAction("Unselect all")
+    self.panel_unselect_all_action.triggered.connect(self.unselect_all_tunnels)
+    self.panel_select_all_action = self.panel_menu.addAction("Select all")
+    self.panel_select_all_action.triggered.connect(self.selected_all_tunnels)
 
   def show_context_menu(
     self,
@@ -1167,8 +1497,6 @@ class MainWindow(QMainWindow):
     tunnel_name: str = None,
     sender: QWidget = None
   ) -> None:
-    menu = QMenu(self)
-
     """
     NOTE: (heycatch) this condition is required when the tunnel is active
     in order to correctly press the "Activate/Deactivate" button.
@@ -1176,171 +1504,84 @@ class MainWindow(QMainWindow):
     if not from_button and not tunnel_name and self.selected_tunnel:
       tunnel_name = self.selected_tunnel
 
-    len_interfaces = len(self.wireguard.read_interfaces_name())
+    len_interfaces = len(self.buttons)
 
     if from_button and tunnel_name:
       self.selected_tunnel = tunnel_name
-      for i in range(self.left_layout.count()):
-        widget = self.left_layout.itemAt(i).widget()
-        if isinstance(widget, TunnelButton):
-          widget.set_selected(
-            widget.text() == tunnel_name or widget.text() in self.selected_tunnels
-          )
+      for name, widget in self.buttons.items():
+        widget.set_selected(name == tunnel_name or name in self.selected_tunnels)
 
-      toggle_action = menu.addAction("Toggle")
-      toggle_action.setEnabled(
+      self.button_toggle_action.setEnabled(
         len_interfaces > 1 and self.selected_tunnel is not None
       )
-      toggle_action.triggered.connect(self.toggle_tunnel)
-
-      menu.addSeparator()
-
-      import_action = menu.addAction("Import tunnel(s) from file...")
-      import_action.setEnabled(False)
-      add_action = menu.addAction("Add empty tunnel...")
-      add_action.setEnabled(False)
-      export_action = menu.addAction("Export all tunnels to zip...")
-      export_action.setEnabled(False)
-
-      menu.addSeparator()
-
-      edit_action = menu.addAction("Edit selected tunnel...")
-      edit_action.setEnabled(
+      self.button_edit_action.setEnabled(
         len_interfaces > 0 and self.selected_tunnel is not None
       )
-      edit_action.triggered.connect(lambda: self.edit_tunnel())
-      remove_action = menu.addAction("Remove selected tunnel(s)...")
-      remove_action.setEnabled(
+      self.button_remove_action.setEnabled(
         len_interfaces > 0 and self.selected_tunnel is not None
       )
-      remove_action.triggered.connect(self.remove_tunnel)
 
-      select_all_action = menu.addAction("Select all")
-      select_all_action.setEnabled(False)
+      menu = self.button_menu
     else:
-      toggle_action = menu.addAction("Toggle")
-      toggle_action.setEnabled(False)
-
-      menu.addSeparator()
-
-      menu.addAction("Import tunnel(s) from file...", self.import_tunnels)
-      menu.addAction("Add empty tunnel...", self.create_tunnel)
-      export_action = menu.addAction("Export all tunnels to zip...")
-      export_action.setEnabled(len_interfaces > 0)
-      export_action.triggered.connect(self.export_tunnels)
-
-      menu.addSeparator()
+      self.panel_export_action.setEnabled(len_interfaces > 0)
+      self.panel_unselect_all_action.setVisible(len(self.selected_tunnels) > 0)
+      self.panel_select_all_action.setVisible(len(self.selected_tunnels) == 0)
 
-      edit_action = menu.addAction("Edit selected tunnel...")
-      edit_action.setEnabled(False)
-      remove_action = menu.addAction("Remove selected tunnel(s)...")
-      remove_action.setEnabled(False)
-
-      if len(self.selected_tunnels) > 0:
-        unselect_all_action = menu.addAction("Unselect all")
-        unselect_all_action.triggered.connect(self.unselect_all_tunnels)
-      else:
-        select_all_action = menu.addAction("Select all")
-        select_all_action.triggered.connect(self.selected_all_tunnels)
+      menu = self.panel_menu
 
     if sender: menu.exec(sender.mapToGlobal(position))
     else: menu.exec(self.left_panel.mapToGlobal(position))
 
   def selected_all_tunnels(self) -> None:
-    for i in range(self.left_layout.count()):
-      widget = self.left_layout.itemAt(i).widget()
-      if isinstance(widget, TunnelButton):
-        widget.set_selected(True)
-        self.selected_tunnels.append(widget.text())
+    for name, widget in self.buttons.items():
+      widget.set_selected(True)
+      self.selected_tunnels.add(name)
 
   def unselect_all_tunnels(self) -> None:
     self.selected_tunnels.clear()
 
-    for i in range(self.left_layout.count()):
-      widget = self.left_layout.itemAt(i).widget()
-      if isinstance(widget, TunnelButton):
-        widget.set_selected(False)
+    for widget in self.buttons.values():
+      widget.set_selected(False)
 
     self.clear_right_panel()
 
   def create_tunnel(self) -> None:
     dialog = TunnelCreationDialog(self.wireguard, self)
     if dialog.exec() == QDialog.DialogCode.Accepted:
-      self.load_interfaces()
+      self.invalidate_ifaces()
+      self.schedule_reload()
 
-  def show_tunnel(self, name: str) -> None:
+  def show_tunnel(self, name: str, config: Optional[dict] = None) -> None:
     self.selected_tunnel = name
-    self.selected_button = None
-
-    for i in range(self.left_layout.count()):
-      widget = self.left_layout.itemAt(i).widget()
-      if isinstance(widget, TunnelButton):
-        widget.set_selected(
-          widget.text() == name or widget.text() in self.selected_tunnels
-        )
-        if widget.text() == name: self.selected_button = widget
 
-    while self.right_layout.count():
-      item = self.right_layout.takeAt(0)
-      if item.widget(): item.widget().deleteLater()
+    for tunnel, widget in self.buttons.items():
+      widget.set_selected(tunnel == name or tunnel in self.selected_tunnels)
 
-    if self.edit_button:
-      self.bottom_layout.removeWidget(self.edit_button)
-      self.edit_button.deleteLater()
-      self.edit_button = None
-
-    config = self.wireguard.read_config(name)
-    stats = self.wireguard.read_stats(name)
+    if config is None: config = self.peek_iface(name)
+    if config is None: config = self.wireguard.read_config(name)
+    stats = self.wireguard.read_stats(name) if self.wireguard.is_up(name) else {}
 
     if len(config) == 0 and len(stats) == 0:
       QMessageBox.warning(self, "Error", "Failed to read the configuration file.")
 
-      import_btn = QPushButton("Import tunnel(s) from file")
-      import_btn.setStyleSheet("font-weight: bold; font-size: 15px;")
-      import_btn.clicked.connect(self.import_tunnels)
-      self.right_layout.addStretch()
-      self.right_layout.addWidget(import_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-      self.right_layout.addStretch()
-      self.right_panel.setLayout(self.right_layout)
+      self.config_widget.hide()
+      self.edit_button.hide()
+      self.import_widget.show()
 
       self.set_icon()
 
       return
 
     is_active = config.get("interface_listen_port", 0) != 0
-    config_widget = TunnelConfigWidget(
-      name, config, stats, self.wireguard, is_active=is_active
-    )
-    config_widget.active_button.clicked.connect(
-      lambda: self.toggle_tunnel(is_active)
-    )
-    self.right_layout.addWidget(config_widget)
-
-    self.edit_button = QPushButton("Edit")
-    self.edit_button.setFixedSize(100, 25)
-    self.edit_button.setStyleSheet(
-      """
-      QPushButton {
-        padding: 5px;
-        border: 1px solid #4FC3F7;
-        border-radius: 3px;
-      }
-      QPushButton:hover {
-        background: #dae7ed;
-      }
-      """
-    )
-    self.edit_button.clicked.connect(lambda: self.edit_tunnel())
-    self.bottom_layout.addWidget(self.edit_button)
+    self.config_widget.retarget(name, config, stats, is_active=is_active)
+    self.import_widget.hide()
+    self.config_widget.show()
+    self.edit_button.show()
 
   def edit_tunnel(self) -> None:
     tunnel_name = None
 
-    for i in range(self.right_layout.count()):
-      widget = self.right_layout.itemAt(i).widget()
-      if isinstance(widget, TunnelConfigWidget):
-        self.selected_tunnel = widget.name
-        break
+    if not self.config_widget.isHidden(): self.selected_tunnel = self.config_widget.name
 
     if tunnel_name is None: tunnel_name = self.selected_tunnel
 
@@ -1356,12 +1597,12 @@ class MainWindow(QMainWindow):
     """
     dialog = TunnelEditDialog(tunnel_name, self.wireguard, self.append_log, self)
     if dialog.exec() == QDialog.DialogCode.Accepted:
-      self.load_interfaces()
+      self.invalidate_ifaces()
+      self.schedule_reload()
 
-      if dialog.name_input.text().strip() in self.wireguard.read_interfaces_name():
-        self.show_tunnel(dialog.name_input.text().strip())
-      else:
-        self.show_tunnel(self.selected_tunnel)
+      new_name = dialog.name_input.text().strip()
+      if new_name in self.wireguard.read_interfaces_name(): self.show_tunnel(new_name)
+      else: self.show_tunnel(self.selected_tunnel)
 
   def toggle_tunnel(self, is_active: bool) -> None:
     if not self.selected_tunnel: return
@@ -1369,52 +1610,45 @@ class MainWindow(QMainWindow):
     new_state = not is_active
     if new_state:
       active_tunnel = None
-      for interface in self.wireguard.read_interfaces_name():
-        config = self.wireguard.read_config(interface)
+      for interface, config in self.iface_snapshot().items():
         if config.get("interface_listen_port", 0) != 0:
           active_tunnel = interface
           break
 
       if active_tunnel and active_tunnel != self.selected_tunnel:
-        try:
-          cmd = ["wg-quick", "down", active_tunnel]
-          res = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=20)
-          self.append_log(cmd, res.stdout, res.stderr)
-        except subprocess.CalledProcessError as e:
-          self.append_log(cmd, e.stdout, e.stderr)
+        if not self.wireguard.wg_quick("down", active_tunnel, self.append_log):
           QMessageBox.warning(self, "Error", f"Failed to stop tunnel {active_tunnel}")
           return
 
-    try:
-      if new_state: cmd = ["wg-quick", "up", self.selected_tunnel]
-      else: cmd = ["wg-quick", "down", self.selected_tunnel]
-      res = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=20)
-      self.append_log(cmd, res.stdout, res.stderr)
-    except subprocess.CalledProcessError as e:
-      self.append_log(cmd, e.stdout, e.stderr)
+    action = "up" if new_state else "down"
+    if not self.wireguard.wg_quick(action, self.selected_tunnel, self.append_log):
       """
       NOTE: (heycatch) in this place we do not need return,
       because we need to update the visual state of buttons and indicators.
       """
       QMessageBox.warning(self, "Error", "Failed to toggle tunnel.")
 
-    for i in range(self.left_layout.count()):
-      widget = self.left_layout.itemAt(i).widget()
-      if isinstance(widget, TunnelButton):
-        config = self.wireguard.read_config(widget.text())
-        widget.is_active = config.get("interface_listen_port", 0) != 0
-        widget.update()
+    self.invalidate_ifaces()
+    snapshot = self.iface_snapshot()
+
+    self.left_widget.setUpdatesEnabled(False)
+    for name, widget in self.buttons.items():
+      config = snapshot.get(name, {})
+      widget.is_active = config.get("interface_listen_port", 0) != 0
+    self.left_widget.setUpdatesEnabled(True)
 
-    self.set_icon()
+    self.set_icon({
+      name: config.get("interface_listen_port", 0) for name, config in snapshot.items()
+    })
 
-    self.show_tunnel(self.selected_tunnel)
+    self.show_tunnel(self.selected_tunnel, config=snapshot.get(self.selected_tunnel, {}))
 
   def remove_tunnel(self) -> None:
     if not self.selected_tunnels and not self.selected_tunnel: return
 
     len_tunnels = len(self.selected_tunnels)
     if len_tunnels > 0:
-      custom_message = f"Are you sure you want to remove {self.selected_tunnels} tunnels?"
+      custom_message = f"Are you sure you want to remove {sorted(self.selected_tunnels)} tunnels?"
     else:
       custom_message = f"Are you sure you want to remove tunnel {self.selected_tunnel}?"
 
@@ -1428,79 +1662,49 @@ class MainWindow(QMainWindow):
     if reply == QMessageBox.StandardButton.Yes:
       if len_tunnels > 0:
         for tunnel in self.selected_tunnels:
-          check_tunnel = self.wireguard.read_config(tunnel)
+          check_tunnel = self.iface_snapshot().get(tunnel, {})
           if check_tunnel.get("interface_listen_port", 0) != 0:
-            try:
-              cmd = ["wg-quick", "down", tunnel]
-              res = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=20)
-              self.append_log(cmd, res.stdout, res.stderr)
-            except subprocess.CalledProcessError as e:
-              self.append_log(cmd, e.stdout, e.stderr)
+            if not self.wireguard.wg_quick("down", tunnel, self.append_log):
               QMessageBox.warning(self, "Error", f"Failed to stop tunnel {tunnel}.")
               continue
 
-          for config in Config.get_folders():
-            if not os.path.exists(config): continue
-
-            path = os.path.join(config, f"{tunnel}.conf")
-            if os.path.isfile(path):
-              try:
-                if not os.access(path, os.W_OK):
-                  QMessageBox.warning(
-                    self,
-                    "Error",
-                    f"No delete permission for {path}."
-                  )
-                  continue
-
-                os.remove(path)
-                break
-              except Exception as e:
-                QMessageBox.warning(
-                  self,
-                  "Error",
-                  f"Failed to delete configuration file: {str(e)}"
-                )
-                continue
-
-        for tunnel in self.selected_tunnels:
-          for i in range(self.left_layout.count()):
-            widget = self.left_layout.itemAt(i).widget()
-            if isinstance(widget, TunnelButton) and widget.text() == tunnel:
-              widget.deleteLater()
+          for path in Config.get_paths(tunnel):
+            try:
+              os.unlink(path)
               break
+            except _NOT_A_CONFIG_FILE:
+              continue
+            except PermissionError:
+              QMessageBox.warning(self, "Error", f"No delete permission for {path}.")
+            except OSError as e:
+              QMessageBox.warning(
+                self,
+                "Error",
+                f"Failed to delete configuration file: {str(e)}"
+              )
 
         self.selected_tunnels.clear()
       else:
-        for path in Config.get_paths(self.selected_tunnel):
-          if os.path.isfile(path):
+        check_tunnel = self.iface_snapshot().get(self.selected_tunnel, {})
+        if check_tunnel.get("interface_listen_port", 0) != 0 and not self.wireguard.wg_quick(
+          "down", self.selected_tunnel, self.append_log
+        ):
+          QMessageBox.warning(
+            self,
+            "Error",
+            f"Failed to stop tunnel {self.selected_tunnel}."
+          )
+        else:
+          for path in Config.get_paths(self.selected_tunnel):
             try:
-              check_tunnel = self.wireguard.read_config(self.selected_tunnel)
-              if check_tunnel.get("interface_listen_port", 0) != 0:
-                try:
-                  cmd = ["wg-quick", "down", self.selected_tunnel]
-                  res = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=20)
-                  self.append_log(cmd, res.stdout, res.stderr)
-                except subprocess.CalledProcessError as e:
-                  self.append_log(cmd, e.stdout, e.stderr)
-                  QMessageBox.warning(
-                    self,
-                    "Error",
-                    f"Failed to stop tunnel {self.selected_tunnel}."
-                  )
-                  break
-
-              if not os.access(path, os.W_OK):
-                QMessageBox.warning(
-                  self,
-                  "Error",
-                  f"No delete permission for {path}."
-                )
-                break
-
-              os.remove(path)
+              os.unlink(path)
               break
-            except Exception as e:
+            except _NOT_A_CONFIG_FILE:
+              continue
+            except PermissionError:
+              QMessageBox.warning(self, "Error", f"No delete permission for {path}.")
+              break
+            except OSError as e:
               QMessageBox.warning(
                 self,
                 "Error",
@@ -1508,126 +1712,163 @@ class MainWindow(QMainWindow):
               )
               return
 
-        for i in range(self.left_layout.count()):
-          widget = self.left_layout.itemAt(i).widget()
-          if isinstance(widget, TunnelButton) and widget.text() == self.selected_tunnel:
-            widget.deleteLater()
-            break
-
       self.clear_right_panel()
 
-      self.load_interfaces()
+      self.invalidate_ifaces()
+      self.schedule_reload()
+
+  def start_io(self, target: callable, *args) -> None:
+    self.io_busy = True
+    self.io_thread = threading.Thread(target=target, args=args)
+    self.io_thread.start()
 
   def import_tunnels(self) -> None:
-    file_dialog = QFileDialog(self)
-    file_dialog.setNameFilter("Config files (*.conf)")
-    file_dialog.setFileMode(QFileDialog.ExistingFiles)
+    if self.io_busy:
+      QMessageBox.warning(self, "Error", "An import or export is still running.")
+      return
 
-    if file_dialog.exec():
-      config_dir = None
-      count = 0
+    selected, _ = QFileDialog.getOpenFileNames(
+      self, "Import tunnels", "", "Config files (*.conf)"
+    )
+    if not selected:
+      QMessageBox.warning(self, "Error", "No files were imported.")
+      return
 
-      for folder in Config.get_folders():
-        if os.path.isdir(folder):
-          config_dir = folder
-          break
+    config_dir = Config.resolve_config_dir()
+    if not config_dir:
+      QMessageBox.warning(self, "Error", "Configuration dirs do not exist.")
+      return
 
-      if not config_dir:
-        QMessageBox.warning(self, "Error", "Configuration dirs do not exist.")
-        return
+    if not os.access(config_dir, os.W_OK):
+      QMessageBox.warning(
+        self,
+        "Error",
+        f"No import permission for {config_dir}."
+      )
+      return
 
-      if not os.access(config_dir, os.W_OK):
-        QMessageBox.warning(
-          self,
-          "Error",
-          f"No import permission for {config_dir}."
-        )
-        return
+    files = {}
+    duplicates = []
+    for file_path in selected:
+      if not file_path.endswith(".conf"): continue
 
-      files = file_dialog.selectedFiles()
-      for file_path in files:
-        try:
-          file_name = os.path.basename(file_path)
-          if not file_name.endswith(".conf"): continue
+      file_name = os.path.basename(file_path)
+      if file_name in files: duplicates.append(file_path)
+      else: files[file_name] = file_path
 
-          dest_path = os.path.join(config_dir, file_name)
-          if os.path.exists(dest_path):
-            reply = QMessageBox.question(
-              self,
-              "File exists",
-              f"File {file_name} already exists. Overwrite?",
-              QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.No: continue
+    if duplicates:
+      QMessageBox.warning(
+        self,
+        "Error",
+        "Several selected files have the same name, these were skipped:\n" + "\n".join(duplicates)
+      )
 
-          with open(file_path, "r", encoding="utf-8") as src_file:
-            with open(dest_path, "w", encoding="utf-8") as dst_file:
-              dst_file.write(src_file.read())
+    with os.scandir(config_dir) as entries:
+      conflicts = sorted(entry.name for entry in entries if entry.name in files)
 
-          count += 1
-        except Exception as e:
-          QMessageBox.warning(
-            self,
-            "Error",
-            f"Failed to import file {file_name}: {str(e)}"
-          )
-          continue
+    if conflicts:
+      button = QMessageBox.StandardButton
+      reply = QMessageBox.question(
+        self,
+        "Files exist",
+        f"{len(conflicts)} file(s) already exist:\n{', '.join(conflicts)}\n\nOverwrite them?",
+        button.Yes | button.No | button.Cancel
+      )
+      if reply == button.Cancel: return
+      if reply == button.No:
+        for file_name in conflicts: del files[file_name]
 
-      if count > 0:
-        QMessageBox.information(
-          self,
-          "Success",
-          f"Successfully imported {count} tunnel(s)."
-        )
+    pairs = [
+      (file_path, os.path.join(config_dir, file_name)) for file_name, file_path in files.items()
+    ]
 
-      self.load_interfaces()
-    else:
-      QMessageBox.warning(self, "Error", "No files were imported.")
+    if not pairs: return
 
-  def export_tunnels(self) -> None:
-    config_dir = None
+    self.start_io(self.run_import, config_dir, pairs)
 
-    for folder in Config.get_folders():
-      if os.path.isdir(folder):
-        config_dir = folder
-        break
+  def run_import(self, config_dir: str, pairs: List[Tuple[str, str]]) -> None:
+    try:
+      failed = _import_configs(config_dir, pairs)
+    except Exception as e:
+      self.import_done.emit(0, [str(e)])
+      return
+
+    self.import_done.emit(len(pairs), failed)
+
+  def import_finished(self, total: int, failed: list) -> None:
+    self.io_busy = False
+    count = max(total - len(failed), 0)
+
+    if failed:
+      QMessageBox.warning(
+        self,
+        "Error",
+        "Failed to import file(s):\n" + "\n".join(failed)
+      )
 
+    if count > 0:
+      QMessageBox.information(
+        self,
+        "Success",
+        f"Successfully imported {count} tunnel(s)."
+      )
+
+    self.invalidate_ifaces()
+    self.schedule_reload()
+
+  def export_tunnels(self) -> None:
+    if self.io_busy:
+      QMessageBox.warning(self, "Error", "An import or export is still running.")
+      return
+
+    config_dir = Config.resolve_config_dir()
     if not config_dir:
       QMessageBox.warning(self, "Error", "Configuration dirs do not exist.")
       return
 
-    conf_files = [f for f in os.listdir(config_dir) if f.endswith(".conf")]
+    with os.scandir(config_dir) as entries:
+      conf_files = [
+        entry for entry in entries
+        if entry.name.endswith(".conf") and entry.is_file()
+      ]
     if not conf_files:
       QMessageBox.warning(self, "Error", "Configuration files do not exist.")
       return
 
-    file_dialog = QFileDialog(self)
-    file_dialog.setAcceptMode(QFileDialog.AcceptSave)
-    file_dialog.setNameFilter("ZIP archives (*.zip)")
-    file_dialog.setDefaultSuffix("zip")
-    file_dialog.selectFile("wireguard_configs.zip")
+    zip_path, _ = QFileDialog.getSaveFileName(
+      self, "Export tunnels", "wireguard_configs.zip", "ZIP archives (*.zip)"
+    )
+    if not zip_path: return
 
-    if not file_dialog.exec(): return
+    if not os.path.splitext(zip_path)[1]: zip_path += ".zip"
 
-    zip_path = file_dialog.selectedFiles()[0]
+    self.start_io(self.run_export, conf_files, zip_path)
 
+  def run_export(self, conf_files: List[os.DirEntry], zip_path: str) -> None:
     try:
-      with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for conf_file in conf_files:
-          full_path = os.path.join(config_dir, conf_file)
-          zipf.write(full_path, arcname=conf_file)
-
-      QMessageBox.information(
-        self,
-        "Success",
-        f"Successfully exported {len(conf_files)} configurations to:\n{zip_path}."
-      )
+      _write_archive(conf_files, zip_path)
+      error = ""
     except Exception as e:
+      error = str(e)
+
+    self.export_done.emit(zip_path, len(conf_files), error)
+
+  def export_finished(self, zip_path: str, count: int, error: str) -> None:
+    self.io_busy = False
+
+    if error:
       QMessageBox.warning(
         self,
         "Error",
-        f"Failed to creat ZIP archive: {str(e)}"
+        f"Failed to creat ZIP archive: {error}"
       )
+      return
+
+    QMessageBox.information(
+      self,
+      "Success",
+      f"Successfully exported {count} configurations to:\n{zip_path}."
+    )
 
 if __name__ == "__main__":
   app = QApplication([])